@@ -1,18 +1,25 @@
 """LekkageAlarm integration initialization."""
 import asyncio
 import logging
-from datetime import datetime, timedelta
+import random
+from collections.abc import Callable
+from datetime import datetime, timezone
+from time import gmtime, strftime
 from typing import Any
 
 import aiohttp
 import voluptuous as vol
 
+try:
+    from orjson import dumps as _json_dumps  # bundled with Home Assistant
+except ImportError:  # pragma: no cover
+    from json import dumps as _json_dumps
+
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import EVENT_HOMEASSISTANT_STOP
 from homeassistant.core import HomeAssistant, ServiceCall, callback
 import homeassistant.helpers.config_validation as cv
-from homeassistant.helpers import aiohttp_client, dispatcher
-from homeassistant.helpers.event import async_track_state_change_event, async_track_time_interval
+from homeassistant.helpers.event import async_track_state_change_event
 
 from .const import (
     DOMAIN,
@@ -28,10 +35,119 @@ from .const import (
     PAIR_ENDPOINT,
     EVENT_ENDPOINT,
     HEARTBEAT_ENDPOINT,
+    EVENTS_BATCH_ENDPOINT,
+    MAX_BATCH_SIZE,
+    BATCH_LINGER_SECONDS,
+    DATA_MONITORS,
+    DATA_SESSIONS,
+    DATA_BATCHERS,
+    DATA_REGISTERED,
+    DATA_SHUTDOWN,
 )
 
 _LOGGER = logging.getLogger(__name__)
 
+# Reused for every collector POST so aiohttp does not rebuild headers or a
+# timeout object per request.
+_POST_HEADERS = {"Content-Type": "application/json", "Connection": "keep-alive"}
+_POST_TIMEOUT = aiohttp.ClientTimeout(total=10)
+
+
+def _get_domain_data(hass: HomeAssistant) -> dict:
+    """Return hass.data[DOMAIN], initializing its sub-structures once."""
+    data = hass.data.setdefault(DOMAIN, {})
+    data.setdefault(DATA_MONITORS, {})
+    return data
+
+
+def _async_get_session(
+    hass: HomeAssistant,
+    collector_url: str,
+    heartbeat_interval: int = DEFAULT_HEARTBEAT_INTERVAL,
+) -> aiohttp.ClientSession:
+    """Return a shared ClientSession for a collector, creating it if needed.
+
+    A dedicated session is kept per collector origin with a keep-alive timeout
+    sized to outlast the heartbeat interval, so periodic POSTs reuse the same
+    TCP/TLS connection instead of paying a full handshake every time.
+    """
+    sessions: dict[str, aiohttp.ClientSession] = hass.data[DOMAIN].setdefault(
+        DATA_SESSIONS, {}
+    )
+    origin = collector_url.rstrip("/")
+    session = sessions.get(origin)
+    if session is None or session.closed:
+        session = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(
+                limit=4, keepalive_timeout=max(30, heartbeat_interval + 15)
+            )
+        )
+        sessions[origin] = session
+        _LOGGER.debug("Created shared collector session for %s", origin)
+        _async_register_shutdown(hass)
+    return session
+
+
+@callback
+def _async_register_shutdown(hass: HomeAssistant) -> None:
+    """Ensure shared sessions and batchers are closed when HA stops.
+
+    Config entries are not unloaded at shutdown, and sessions created during
+    an abandoned config flow never reach unload at all, so a stop listener is
+    the only reliable close path (mirroring HA's own clientsession helper).
+    """
+    data = hass.data[DOMAIN]
+    if data.get(DATA_SHUTDOWN):
+        return
+    data[DATA_SHUTDOWN] = True
+
+    async def _async_close_all(event) -> None:
+        for batcher in data.pop(DATA_BATCHERS, {}).values():
+            await batcher.async_stop()
+        for session in data.pop(DATA_SESSIONS, {}).values():
+            if not session.closed:
+                await session.close()
+
+    hass.bus.async_listen_once(EVENT_HOMEASSISTANT_STOP, _async_close_all)
+
+
+def _async_get_batcher(
+    hass: HomeAssistant, collector_url: str, session: aiohttp.ClientSession
+) -> "_BatchSender":
+    """Return the shared batch sender for a collector, creating it if needed."""
+    batchers: dict[str, _BatchSender] = hass.data[DOMAIN].setdefault(DATA_BATCHERS, {})
+    origin = collector_url.rstrip("/")
+    batcher = batchers.get(origin)
+    if batcher is None:
+        batcher = _BatchSender(hass, origin, session)
+        batchers[origin] = batcher
+    return batcher
+
+
+async def _async_release_batcher(hass: HomeAssistant, collector_url: str) -> None:
+    """Stop the shared batch sender for a collector once no monitor uses it."""
+    origin = collector_url.rstrip("/")
+    data = hass.data.get(DOMAIN, {})
+    for monitor in data.get(DATA_MONITORS, {}).values():
+        if monitor.collector_url == origin:
+            return
+    batcher = data.get(DATA_BATCHERS, {}).pop(origin, None)
+    if batcher:
+        await batcher.async_stop()
+
+
+async def _async_release_session(hass: HomeAssistant, collector_url: str) -> None:
+    """Close the shared session for a collector once no monitor uses it."""
+    origin = collector_url.rstrip("/")
+    data = hass.data.get(DOMAIN, {})
+    for monitor in data.get(DATA_MONITORS, {}).values():
+        if monitor.collector_url == origin:
+            return
+    session = data.get(DATA_SESSIONS, {}).pop(origin, None)
+    if session and not session.closed:
+        await session.close()
+        _LOGGER.debug("Closed shared collector session for %s", origin)
+
 
 def _validate_auth(obj: dict) -> dict:
     """Validate that at least one of token or pairing code is provided in YAML."""
@@ -73,7 +189,7 @@ CONFIG_SCHEMA = vol.Schema(
 
 async def async_setup(hass: HomeAssistant, config: dict) -> bool:
     """Set up the LekkageAlarm component from YAML configuration."""
-    hass.data.setdefault(DOMAIN, {})
+    _get_domain_data(hass)
     _register_services(hass)
 
     if DOMAIN not in config:
@@ -91,7 +207,7 @@ async def async_setup(hass: HomeAssistant, config: dict) -> bool:
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Set up LekkageAlarm from a config entry (UI or import)."""
-    hass.data.setdefault(DOMAIN, {})
+    domain_data = _get_domain_data(hass)
     _register_services(hass)
 
     data = entry.data
@@ -102,11 +218,13 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     states = [s.lower().strip() for s in data.get(CONF_MONITORED_STATES, [])]
     interval = data.get(CONF_HEARTBEAT_INTERVAL, DEFAULT_HEARTBEAT_INTERVAL)
 
+    session = _async_get_session(hass, collector_url, interval)
+    batcher = _async_get_batcher(hass, collector_url, session)
     monitor = LekkageAlarmMonitor(
-        hass, entry, collector_url, token, entity_id, attribute, states, interval
+        hass, entry, collector_url, token, entity_id, attribute, states, interval, batcher
     )
     await monitor.async_start()
-    hass.data[DOMAIN][entry.entry_id] = monitor
+    domain_data[DATA_MONITORS][entry.entry_id] = monitor
 
     try:
         await hass.config_entries.async_forward_entry_setups(entry, ["sensor"])
@@ -117,13 +235,174 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
 
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Unload a config entry."""
-    monitor: LekkageAlarmMonitor | None = hass.data[DOMAIN].pop(entry.entry_id, None)
+    monitor: LekkageAlarmMonitor | None = hass.data[DOMAIN][DATA_MONITORS].pop(
+        entry.entry_id, None
+    )
     if monitor:
         await monitor.async_stop()
+        await _async_release_batcher(hass, monitor.collector_url)
+        await _async_release_session(hass, monitor.collector_url)
     unloaded = await hass.config_entries.async_unload_platforms(entry, ["sensor"])
     return bool(unloaded)
 
 
+class _BatchSender:
+    """Coalesce collector POSTs from all monitors sharing one collector URL.
+
+    Payloads are queued and drained by a single background task, which sends
+    them as one JSON array to the batch endpoint so N monitors cost one
+    round-trip instead of N. If the server does not implement the batch
+    endpoint (404), the sender permanently falls back to per-item POSTs.
+    """
+
+    def __init__(
+        self, hass: HomeAssistant, collector_url: str, session: aiohttp.ClientSession
+    ) -> None:
+        self.hass = hass
+        self.collector_url = collector_url.rstrip("/")
+        self._session = session
+        self._batch_url = self.collector_url + EVENTS_BATCH_ENDPOINT
+        self._endpoint_urls = {
+            EVENT_ENDPOINT: self.collector_url + EVENT_ENDPOINT,
+            HEARTBEAT_ENDPOINT: self.collector_url + HEARTBEAT_ENDPOINT,
+        }
+        self._queue: asyncio.Queue = asyncio.Queue()
+        self._batch_supported = True
+        self._task = hass.loop.create_task(self._async_run())
+
+    async def async_send(self, endpoint: str, payload: dict[str, Any]) -> bool:
+        """Queue a payload for delivery and wait for the send result."""
+        if self._task.done():
+            # Stopped (e.g. at shutdown while monitors still see state
+            # changes); nothing will drain the queue anymore.
+            return False
+        future: asyncio.Future = self.hass.loop.create_future()
+        self._queue.put_nowait((endpoint, payload, future))
+        return await future
+
+    async def async_stop(self) -> None:
+        """Cancel the drain task and fail any payloads still queued."""
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        while not self._queue.empty():
+            _, _, future = self._queue.get_nowait()
+            if not future.done():
+                future.set_result(False)
+
+    async def _async_run(self) -> None:
+        """Drain the queue, coalescing payloads that arrive close together."""
+        while True:
+            items = [await self._queue.get()]
+            try:
+                while len(items) < MAX_BATCH_SIZE:
+                    try:
+                        items.append(
+                            await asyncio.wait_for(
+                                self._queue.get(), BATCH_LINGER_SECONDS
+                            )
+                        )
+                    except asyncio.TimeoutError:
+                        break
+                await self._async_send_items(items)
+            except Exception:  # noqa: BLE001
+                # The drain task must survive anything a misbehaving server
+                # throws at it; callers are waiting on these futures.
+                _LOGGER.exception(
+                    "Unexpected error sending to collector %s", self.collector_url
+                )
+            finally:
+                # Also runs when async_stop cancels the linger wait or a send
+                # in flight, so every dequeued item is failed instead of left
+                # pending.
+                for _, _, future in items:
+                    if not future.done():
+                        future.set_result(False)
+
+    async def _async_send_items(self, items: list) -> None:
+        """Send a drained batch, falling back to per-item POSTs if unsupported."""
+        if self._batch_supported:
+            status = await self._async_post_to_collector(
+                self._batch_url,
+                {"events": [payload for _, payload, _ in items]},
+            )
+            if status != 404:
+                for _, _, future in items:
+                    if not future.done():
+                        future.set_result(status == 200)
+                return
+            self._batch_supported = False
+            _LOGGER.debug(
+                "Collector %s has no batch endpoint, falling back to per-item POSTs",
+                self.collector_url,
+            )
+        for endpoint, payload, future in items:
+            status = await self._async_post_to_collector(
+                self._endpoint_urls[endpoint], payload
+            )
+            if not future.done():
+                future.set_result(status == 200)
+
+    async def _async_post_to_collector(
+        self, url: str, payload: dict[str, Any]
+    ) -> int | None:
+        """Send a POST request to the collector URL with retries.
+
+        Returns the last HTTP status, or None if no response was received.
+        """
+        status: int | None = None
+        body = _json_dumps(payload)
+        for attempt in range(1, 4):
+            try:
+                async with self._session.post(
+                    url, data=body, headers=_POST_HEADERS, timeout=_POST_TIMEOUT
+                ) as resp:
+                    status = resp.status
+                    if status == 200:
+                        # Only read the body when debug logging will use it.
+                        if _LOGGER.isEnabledFor(logging.DEBUG):
+                            text = await resp.text()
+                            _LOGGER.debug(
+                                "Collector response: %s",
+                                text.strip() if text else "<no body>",
+                            )
+                        else:
+                            resp.release()
+                        return status
+                    text = await resp.text()
+                    _LOGGER.error(
+                        "Collector API error (status %s) on attempt %d: %s",
+                        resp.status,
+                        attempt,
+                        text.strip() if text else "<no body>",
+                    )
+                    if 400 <= resp.status < 500:
+                        # Client errors will not be fixed by retrying.
+                        return status
+            except asyncio.TimeoutError:
+                _LOGGER.warning(
+                    "Timeout connecting to collector API (attempt %d) for %s",
+                    attempt,
+                    url,
+                )
+            except aiohttp.ClientError as err:
+                _LOGGER.warning(
+                    "Network error communicating with collector API (attempt %d): %s",
+                    attempt,
+                    err,
+                )
+            if attempt < 3:
+                # Jittered exponential backoff so monitors sharing an outage
+                # do not retry in lockstep against a recovering collector.
+                await asyncio.sleep(
+                    min(8.0, random.uniform(0.5, 1.5) * (2 ** (attempt - 1)))
+                )
+        _LOGGER.error("Failed to send data to collector API %s after 3 attempts.", url)
+        return status
+
+
 class LekkageAlarmMonitor:
     """Manage monitoring of one sensor and communication with the collector API."""
 
@@ -137,6 +416,7 @@ class LekkageAlarmMonitor:
         attribute: str | None,
         trigger_states: list[str],
         interval: int,
+        batcher: _BatchSender,
     ) -> None:
         self.hass = hass
         self.entry = entry
@@ -144,59 +424,106 @@ class LekkageAlarmMonitor:
         self.token = token
         self.entity_id = entity_id
         self.attribute = attribute
-        self.trigger_states = [s.lower().strip() for s in trigger_states]
+        # Caller already lowercased/stripped; a frozenset gives O(1) membership
+        # checks on the state-change hot path.
+        self.trigger_states: frozenset[str] = frozenset(trigger_states)
         self.heartbeat_interval = interval
+        self._batcher = batcher
+        # Constant payload fields, copied per send instead of rebuilt key by key.
+        self._event_base = {
+            "token": token,
+            "entity_id": entity_id,
+            "attribute": attribute if attribute else "state",
+            "type": "state_change",
+        }
+        self._heartbeat_base = {
+            "token": token,
+            "entity_id": entity_id,
+            "type": "heartbeat",
+        }
+        self._post_lock = asyncio.Lock()
+        self._pending_value: str | None = None
+        # Lowercased value from the previous event, so the listener does not
+        # have to re-lowercase old_val on every state change.
+        self._last_lower_state: str | None = None
+        self._listeners: list[Callable[[datetime | None], None]] = []
         self._unsub_state = None
-        self._unsub_heartbeat = None
+        self._heartbeat_handle: asyncio.TimerHandle | None = None
+        self._stopped = False
         self.last_contact_time: datetime | None = None
         self.last_event_time: datetime | None = None
         self.last_event_value: str | None = None
         self.last_heartbeat_time: datetime | None = None
 
-    async def async_start(self) -> None:
-        """Start monitoring the sensor state and scheduling heartbeats."""
+    @callback
+    def async_add_listener(
+        self, update_callback: Callable[[datetime | None], None]
+    ) -> Callable[[], None]:
+        """Subscribe to contact-time updates; returns an unsubscribe callable.
+
+        Entities are called directly instead of going through the dispatcher,
+        which skips its signal lookup and wrapping per update.
+        """
+        self._listeners.append(update_callback)
 
         @callback
-        def _state_change_listener(event) -> None:
-            new_state = event.data.get("new_state")
-            old_state = event.data.get("old_state")
-            if new_state is None:
-                return
+        def _remove_listener() -> None:
+            self._listeners.remove(update_callback)
 
-            if self.attribute:
-                new_val = new_state.attributes.get(self.attribute)
-                old_val = old_state.attributes.get(self.attribute) if old_state else None
-            else:
-                new_val = new_state.state
-                old_val = old_state.state if old_state else None
+        return _remove_listener
 
-            if new_val is None:
-                return
+    @callback
+    def _on_state_change(self, event) -> None:
+        """Handle a state_changed event for the monitored entity."""
+        new_state = event.data.get("new_state")
+        old_state = event.data.get("old_state")
+        if new_state is None:
+            return
 
-            str_new = str(new_val).lower()
-            str_old = str(old_val).lower() if old_val is not None else None
-
-            if str_new != str_old and (
-                not self.trigger_states or str_new in self.trigger_states
-            ):
-                _LOGGER.info(
-                    "LekkageAlarm: Detected state change for %s: %s -> %s",
-                    self.entity_id,
-                    str_old,
-                    str_new,
-                )
-                self.hass.async_create_task(self._async_handle_trigger_event(str_new))
+        if self.attribute:
+            new_val = new_state.attributes.get(self.attribute)
+            old_val = old_state.attributes.get(self.attribute) if old_state else None
+        else:
+            new_val = new_state.state
+            old_val = old_state.state if old_state else None
+
+        if new_val is None:
+            return
+
+        # Other attributes changing fire state_changed too; bail out before
+        # any stringification when the monitored value is unchanged.
+        if new_val == old_val:
+            return
+
+        str_new = str(new_val).lower()
+        str_old = self._last_lower_state
+        if str_old is None and old_val is not None:
+            str_old = str(old_val).lower()
+        self._last_lower_state = str_new
+
+        if str_new != str_old and (
+            not self.trigger_states or str_new in self.trigger_states
+        ):
+            _LOGGER.info(
+                "LekkageAlarm: Detected state change for %s: %s -> %s",
+                self.entity_id,
+                str_old,
+                str_new,
+            )
+            self.hass.async_create_task(self._async_handle_trigger_event(str_new))
 
+    async def async_start(self) -> None:
+        """Start monitoring the sensor state and scheduling heartbeats."""
         self._unsub_state = async_track_state_change_event(
-            self.hass, [self.entity_id], _state_change_listener
+            self.hass, [self.entity_id], self._on_state_change
         )
         _LOGGER.debug("Started state change listener for %s", self.entity_id)
 
         if self.heartbeat_interval > 0:
-            self._unsub_heartbeat = async_track_time_interval(
-                self.hass,
-                self._async_handle_heartbeat,
-                timedelta(seconds=self.heartbeat_interval),
+            # A plain loop timer is enough for an hourly cadence and keeps the
+            # monitor out of HA's wall-clock time-tracking machinery.
+            self._heartbeat_handle = self.hass.loop.call_later(
+                self.heartbeat_interval, self._fire_heartbeat
             )
             _LOGGER.debug(
                 "Scheduled heartbeat every %s seconds for %s",
@@ -212,6 +539,7 @@ class LekkageAlarmMonitor:
                 cur_val = current_state.state
             if cur_val is not None:
                 cur_val_str = str(cur_val).lower()
+                self._last_lower_state = cur_val_str
                 if not self.trigger_states or cur_val_str in self.trigger_states:
                     _LOGGER.info(
                         "LekkageAlarm: Initial state of %s is '%s' which is a trigger, sending initial event.",
@@ -222,51 +550,70 @@ class LekkageAlarmMonitor:
                         self._async_handle_trigger_event(cur_val_str)
                     )
 
-        self.hass.bus.async_listen_once(
-            EVENT_HOMEASSISTANT_STOP,
-            lambda event: asyncio.create_task(self.async_stop()),
+        self.entry.async_on_unload(
+            self.hass.bus.async_listen_once(
+                EVENT_HOMEASSISTANT_STOP, self._on_hass_stop
+            )
         )
 
+    async def _on_hass_stop(self, event) -> None:
+        """Stop the monitor when Home Assistant shuts down."""
+        await self.async_stop()
+
     async def async_stop(self) -> None:
         """Stop monitoring and cancel scheduled tasks."""
+        self._stopped = True
         if self._unsub_state:
             self._unsub_state()
             self._unsub_state = None
-        if self._unsub_heartbeat:
-            self._unsub_heartbeat()
-            self._unsub_heartbeat = None
+        if self._heartbeat_handle:
+            self._heartbeat_handle.cancel()
+            self._heartbeat_handle = None
         _LOGGER.debug("Stopped LekkageAlarm monitor for %s", self.entity_id)
 
     async def _async_handle_trigger_event(self, new_value: str) -> None:
         """Handle a state change that matches trigger states (send event to server)."""
-        payload = {
-            "token": self.token,
-            "entity_id": self.entity_id,
-            "attribute": self.attribute if self.attribute else "state",
-            "new_state": new_value,
-            "timestamp": datetime.utcnow().strftime("%Y-%m-%dT%H:%M:%SZ"),
-            "type": "state_change",
-        }
-        url = f"{self.collector_url}{EVENT_ENDPOINT}"
-        success = await self._async_post_to_collector(url, payload)
+        # Coalesce bursts from a flapping sensor: the lock serializes sends so
+        # retry delays cannot stack tasks, and only the newest pending value is
+        # actually posted - stale tasks bail out below.
+        self._pending_value = new_value
+        async with self._post_lock:
+            if self._pending_value != new_value:
+                return
+            self._pending_value = None
+            await self._async_send_trigger_event(new_value)
+
+    async def _async_send_trigger_event(self, new_value: str) -> None:
+        """Build and send a state-change payload to the collector."""
+        payload = dict(self._event_base)
+        payload["new_state"] = new_value
+        payload["timestamp"] = strftime("%Y-%m-%dT%H:%M:%SZ", gmtime())
+        success = await self._batcher.async_send(EVENT_ENDPOINT, payload)
         if success:
-            self.last_event_time = datetime.utcnow()
+            self.last_event_time = datetime.now(timezone.utc)
             self.last_event_value = new_value
             self.last_contact_time = self.last_event_time
-            dispatcher.async_dispatcher_send(
-                self.hass,
-                f"{DOMAIN}_{self.entry.entry_id}_update",
-                self.last_contact_time,
+            for update_callback in self._listeners:
+                update_callback(self.last_contact_time)
+
+    @callback
+    def _fire_heartbeat(self) -> None:
+        """Run a scheduled heartbeat and chain the next timer afterwards."""
+        self._heartbeat_handle = None
+        self.hass.async_create_task(self._async_heartbeat_and_reschedule())
+
+    async def _async_heartbeat_and_reschedule(self) -> None:
+        """Send a heartbeat, then schedule the next one unless stopped."""
+        await self._async_handle_heartbeat()
+        if not self._stopped:
+            self._heartbeat_handle = self.hass.loop.call_later(
+                self.heartbeat_interval, self._fire_heartbeat
             )
 
     async def _async_handle_heartbeat(self, now: datetime | None = None) -> None:
         """Send a periodic heartbeat to the collector server."""
-        payload: dict[str, Any] = {
-            "token": self.token,
-            "entity_id": self.entity_id,
-            "timestamp": datetime.utcnow().strftime("%Y-%m-%dT%H:%M:%SZ"),
-            "type": "heartbeat",
-        }
+        payload: dict[str, Any] = dict(self._heartbeat_base)
+        payload["timestamp"] = strftime("%Y-%m-%dT%H:%M:%SZ", gmtime())
         current_state = self.hass.states.get(self.entity_id)
         if current_state:
             if self.attribute:
@@ -275,53 +622,14 @@ class LekkageAlarmMonitor:
                 cur_val = current_state.state
             if cur_val is not None:
                 payload["current_state"] = str(cur_val)
-        url = f"{self.collector_url}{HEARTBEAT_ENDPOINT}"
-        success = await self._async_post_to_collector(url, payload)
+        success = await self._batcher.async_send(HEARTBEAT_ENDPOINT, payload)
         if success:
-            self.last_heartbeat_time = datetime.utcnow()
+            self.last_heartbeat_time = datetime.now(timezone.utc)
             self.last_contact_time = self.last_heartbeat_time
-            dispatcher.async_dispatcher_send(
-                self.hass,
-                f"{DOMAIN}_{self.entry.entry_id}_update",
-                self.last_contact_time,
-            )
+            for update_callback in self._listeners:
+                update_callback(self.last_contact_time)
             _LOGGER.debug("Heartbeat sent for %s", self.entity_id)
 
-    async def _async_post_to_collector(self, url: str, payload: dict[str, Any]) -> bool:
-        """Send a POST request to the collector URL with retries."""
-        session = aiohttp_client.async_get_clientsession(self.hass)
-        for attempt in range(1, 4):
-            try:
-                async with session.post(url, json=payload, timeout=10) as resp:
-                    text = await resp.text()
-                    if resp.status == 200:
-                        _LOGGER.debug(
-                            "Collector response: %s",
-                            text.strip() if text else "<no body>",
-                        )
-                        return True
-                    _LOGGER.error(
-                        "Collector API error (status %s) on attempt %d: %s",
-                        resp.status,
-                        attempt,
-                        text.strip() if text else "<no body>",
-                    )
-            except asyncio.TimeoutError:
-                _LOGGER.warning(
-                    "Timeout connecting to collector API (attempt %d) for %s",
-                    attempt,
-                    url,
-                )
-            except aiohttp.ClientError as err:
-                _LOGGER.warning(
-                    "Network error communicating with collector API (attempt %d): %s",
-                    attempt,
-                    err,
-                )
-            await asyncio.sleep(attempt)
-        _LOGGER.error("Failed to send data to collector API %s after 3 attempts.", url)
-        return False
-
     async def send_current_state(self) -> None:
         """Send the current state of the monitored sensor to the collector."""
         state_obj = self.hass.states.get(self.entity_id)
@@ -351,57 +659,43 @@ class LekkageAlarmMonitor:
 
 def _register_services(hass: HomeAssistant) -> None:
     """Register integration services once."""
-    if not hass.services.has_service(DOMAIN, "send_heartbeat"):
-        hass.services.async_register(
-            DOMAIN,
-            "send_heartbeat",
-            _async_handle_send_heartbeat,
-            schema=vol.Schema({vol.Optional("entity_id"): cv.entity_ids}),
-        )
-    if not hass.services.has_service(DOMAIN, "send_state"):
-        hass.services.async_register(
-            DOMAIN,
-            "send_state",
-            _async_handle_send_state,
-            schema=vol.Schema({vol.Optional("entity_id"): cv.entity_ids}),
-        )
+    data = hass.data[DOMAIN]
+    if data.get(DATA_REGISTERED):
+        return
+    data[DATA_REGISTERED] = True
+    hass.services.async_register(
+        DOMAIN,
+        "send_heartbeat",
+        _async_handle_send_heartbeat,
+        schema=vol.Schema({vol.Optional("entity_id"): cv.entity_ids}),
+    )
+    hass.services.async_register(
+        DOMAIN,
+        "send_state",
+        _async_handle_send_state,
+        schema=vol.Schema({vol.Optional("entity_id"): cv.entity_ids}),
+    )
+
+
+def _service_targets(service_call: ServiceCall) -> list["LekkageAlarmMonitor"]:
+    """Return the monitors addressed by a service call."""
+    monitors = service_call.hass.data.get(DOMAIN, {}).get(DATA_MONITORS, {})
+    entity_ids = service_call.data.get("entity_id")
+    if not entity_ids:
+        return list(monitors.values())
+    wanted = set(entity_ids)
+    return [m for m in monitors.values() if m.entity_id in wanted]
 
 
 async def _async_handle_send_heartbeat(service_call: ServiceCall) -> None:
     """Service handler to send heartbeat(s) on demand."""
-    hass = service_call.hass
-    entity_ids = service_call.data.get("entity_id")
-    targets: list[LekkageAlarmMonitor] = []
-
-    if entity_ids:
-        for monitor in hass.data.get(DOMAIN, {}).values():
-            if isinstance(monitor, LekkageAlarmMonitor) and monitor.entity_id in entity_ids:
-                targets.append(monitor)
-    else:
-        for monitor in hass.data.get(DOMAIN, {}).values():
-            if isinstance(monitor, LekkageAlarmMonitor):
-                targets.append(monitor)
-
-    for monitor in targets:
+    for monitor in _service_targets(service_call):
         _LOGGER.info("Manual heartbeat trigger for %s", monitor.entity_id)
         await monitor.send_heartbeat()
 
 
 async def _async_handle_send_state(service_call: ServiceCall) -> None:
     """Service handler to send current state on demand."""
-    hass = service_call.hass
-    entity_ids = service_call.data.get("entity_id")
-    targets: list[LekkageAlarmMonitor] = []
-
-    if entity_ids:
-        for monitor in hass.data.get(DOMAIN, {}).values():
-            if isinstance(monitor, LekkageAlarmMonitor) and monitor.entity_id in entity_ids:
-                targets.append(monitor)
-    else:
-        for monitor in hass.data.get(DOMAIN, {}).values():
-            if isinstance(monitor, LekkageAlarmMonitor):
-                targets.append(monitor)
-
-    for monitor in targets:
+    for monitor in _service_targets(service_call):
         _LOGGER.info("Manual state send trigger for %s", monitor.entity_id)
         await monitor.send_current_state()
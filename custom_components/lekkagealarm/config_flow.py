@@ -3,7 +3,6 @@ import logging
 
 import voluptuous as vol
 from homeassistant import config_entries
-from homeassistant.helpers import aiohttp_client
 from homeassistant.helpers.selector import (
     EntitySelector,
     EntitySelectorConfig,
@@ -11,6 +10,7 @@ from homeassistant.helpers.selector import (
     SelectSelectorConfig,
 )
 
+from . import _async_get_session
 from .const import (
     DOMAIN,
     CONF_COLLECTOR_URL,
@@ -26,6 +26,29 @@ from .const import (
 
 _LOGGER = logging.getLogger(__name__)
 
+# Form schemas are pure data; build them once instead of per render.
+_SETTINGS_SCHEMA = vol.Schema(
+    {
+        vol.Required(CONF_COLLECTOR_URL): str,
+        vol.Optional(CONF_PAIRING_CODE, default=""): str,
+    }
+)
+
+_DEVICE_SCHEMA = vol.Schema(
+    {
+        vol.Required(CONF_ENTITY_ID): EntitySelector(EntitySelectorConfig()),
+        vol.Optional(CONF_ATTRIBUTE, default=""): str,
+        vol.Optional(CONF_MONITORED_STATES, default=[]): SelectSelector(
+            SelectSelectorConfig(
+                options=[],
+                multiple=True,
+                custom_value=True,
+            )
+        ),
+        vol.Optional(CONF_HEARTBEAT_INTERVAL, default=DEFAULT_HEARTBEAT_INTERVAL): int,
+    }
+)
+
 
 class LekkageAlarmConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
     """Handle a config flow for LekkageAlarm."""
@@ -34,6 +57,7 @@ class LekkageAlarmConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
 
     _settings: dict | None = None
     _cached_token: str | None = None
+    _token_index: dict | None = None
 
     async def async_step_user(self, user_input=None):
         """Entry point for the flow."""
@@ -75,14 +99,8 @@ class LekkageAlarmConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                 self._cached_token = token
                 return await self.async_step_device()
 
-        data_schema = vol.Schema(
-            {
-                vol.Required(CONF_COLLECTOR_URL): str,
-                vol.Optional(CONF_PAIRING_CODE, default=""): str,
-            }
-        )
         return self.async_show_form(
-            step_id="settings", data_schema=data_schema, errors=errors
+            step_id="settings", data_schema=_SETTINGS_SCHEMA, errors=errors
         )
 
     async def async_step_device(self, user_input=None):
@@ -116,26 +134,8 @@ class LekkageAlarmConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                 name = state_obj.name
             return self.async_create_entry(title=f"{name} LekkageAlarm", data=data)
 
-        data_schema = vol.Schema(
-            {
-                vol.Required(CONF_ENTITY_ID): EntitySelector(
-                    EntitySelectorConfig()
-                ),
-                vol.Optional(CONF_ATTRIBUTE, default=""): str,
-                vol.Optional(CONF_MONITORED_STATES, default=[]): SelectSelector(
-                    SelectSelectorConfig(
-                        options=[],
-                        multiple=True,
-                        custom_value=True,
-                    )
-                ),
-                vol.Optional(
-                    CONF_HEARTBEAT_INTERVAL, default=DEFAULT_HEARTBEAT_INTERVAL
-                ): int,
-            }
-        )
         return self.async_show_form(
-            step_id="device", data_schema=data_schema, errors=errors
+            step_id="device", data_schema=_DEVICE_SCHEMA, errors=errors
         )
 
     async def async_step_import(self, import_config: dict):
@@ -167,7 +167,11 @@ class LekkageAlarmConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         )
 
     def _normalize_monitored_states(self, value):
-        """Normalize monitored states input from selector (list) or comma string."""
+        """Normalize monitored states input from selector (list) or comma string.
+
+        Values are lowercased here so stored config is canonical and runtime
+        code does not need to re-normalize.
+        """
         if value is None:
             return []
         if isinstance(value, list):
@@ -176,20 +180,25 @@ class LekkageAlarmConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                 for part in str(item).split(","):
                     part = part.strip()
                     if part:
-                        out.append(part)
+                        out.append(part.lower())
             return out
-        return [s.strip() for s in str(value).split(",") if s.strip()]
+        return [s.strip().lower() for s in str(value).split(",") if s.strip()]
 
     def _get_cached_token(self, collector_url: str):
-        """Return token from existing entries for this collector URL, if any."""
-        normalized = collector_url.rstrip("/")
-        for entry in self._async_current_entries():
-            existing_url = entry.data.get(CONF_COLLECTOR_URL, "").rstrip("/")
-            if existing_url == normalized:
-                token = entry.data.get(CONF_TOKEN)
-                if token:
-                    return token
-        return None
+        """Return token from existing entries for this collector URL, if any.
+
+        The URL-to-token index is built once per flow instance so repeated
+        form submissions do not rescan every config entry.
+        """
+        if self._token_index is None:
+            self._token_index = {
+                entry.data.get(CONF_COLLECTOR_URL, "").rstrip("/"): entry.data[
+                    CONF_TOKEN
+                ]
+                for entry in self._async_current_entries()
+                if entry.data.get(CONF_TOKEN)
+            }
+        return self._token_index.get(collector_url.rstrip("/"))
 
     def _get_existing_token(self):
         """Return the first existing collector URL + token if any are configured."""
@@ -202,7 +211,8 @@ class LekkageAlarmConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
 
     async def _async_pair(self, base_url: str, code: str) -> str:
         """Call the pairing endpoint and return the token."""
-        session = aiohttp_client.async_get_clientsession(self.hass)
+        self.hass.data.setdefault(DOMAIN, {})
+        session = _async_get_session(self.hass, base_url)
         pair_url = f"{base_url.rstrip('/')}" + PAIR_ENDPOINT
         async with session.post(pair_url, json={"code": code}, timeout=10) as resp:
             if resp.status != 200:
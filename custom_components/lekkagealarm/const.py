@@ -19,6 +19,18 @@ DEFAULT_ATTRIBUTE = None
 PAIR_ENDPOINT = "/pair"
 EVENT_ENDPOINT = "/event"
 HEARTBEAT_ENDPOINT = "/heartbeat"
+EVENTS_BATCH_ENDPOINT = "/events"
+
+# Batching of collector POSTs
+MAX_BATCH_SIZE = 32
+BATCH_LINGER_SECONDS = 0.1
+
+# Keys inside hass.data[DOMAIN]
+DATA_MONITORS = "_monitors"
+DATA_SESSIONS = "_sessions"
+DATA_BATCHERS = "_batchers"
+DATA_REGISTERED = "_registered"
+DATA_SHUTDOWN = "_shutdown"
 
 # Other constants
 ATTR_LAST_CONTACT = "last_contact"
@@ -1,47 +1,44 @@
 """Diagnostics support for LekkageAlarm."""
 from __future__ import annotations
 
+from homeassistant.components.diagnostics import async_redact_data
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
 
-from .const import CONF_TOKEN, DOMAIN
+from .const import CONF_TOKEN, DATA_MONITORS, DOMAIN
+
+TO_REDACT = {CONF_TOKEN}
 
 
 async def async_get_config_entry_diagnostics(
     hass: HomeAssistant, entry: ConfigEntry
 ) -> dict:
     """Return diagnostics for a config entry."""
-    monitor = hass.data.get(DOMAIN, {}).get(entry.entry_id)
-
-    config_data = {**entry.data}
-    if CONF_TOKEN in config_data:
-        token = config_data[CONF_TOKEN]
-        if isinstance(token, str) and len(token) > 4:
-            config_data[CONF_TOKEN] = token[:4] + "****"
-        else:
-            config_data[CONF_TOKEN] = "****"
-
-    diagnostics: dict = {
+    domain_data = hass.data.get(DOMAIN)
+    monitors = domain_data.get(DATA_MONITORS) if domain_data else None
+    monitor = monitors.get(entry.entry_id) if monitors else None
+
+    # Redaction copies the mapping; when there is nothing to redact a plain
+    # dict copy suffices (entry.data itself is a MappingProxyType, which the
+    # diagnostics JSON encoder cannot serialize as a mapping).
+    if CONF_TOKEN in entry.data:
+        config_data = async_redact_data(entry.data, TO_REDACT)
+    else:
+        config_data = dict(entry.data)
+
+    # HA's diagnostics JSON encoder serializes datetimes natively.
+    return {
         "config_entry": {
             "data": config_data,
             "title": entry.title,
         },
-        "monitor_status": None,
-    }
-
-    if monitor:
-        diagnostics["monitor_status"] = {
+        "monitor_status": {
             "entity_id": monitor.entity_id,
-            "last_event_time": monitor.last_event_time.isoformat()
-            if monitor.last_event_time
-            else None,
+            "last_event_time": monitor.last_event_time,
             "last_event_value": monitor.last_event_value,
-            "last_heartbeat_time": monitor.last_heartbeat_time.isoformat()
-            if monitor.last_heartbeat_time
-            else None,
-            "last_contact_time": monitor.last_contact_time.isoformat()
-            if monitor.last_contact_time
-            else None,
+            "last_heartbeat_time": monitor.last_heartbeat_time,
+            "last_contact_time": monitor.last_contact_time,
         }
-
-    return diagnostics
+        if monitor
+        else None,
+    }
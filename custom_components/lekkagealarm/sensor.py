@@ -1,10 +1,20 @@
 """Sensor platform for the LekkageAlarm integration."""
 from __future__ import annotations
 
+from datetime import timezone
+
 from homeassistant.components.sensor import SensorDeviceClass, SensorEntity
-from homeassistant.helpers import device_registry, dispatcher, entity_registry
+from homeassistant.core import callback
+from homeassistant.helpers import device_registry, entity_registry
+
+from .const import DATA_MONITORS, DOMAIN
 
-from .const import DOMAIN
+
+def _normalize_contact_time(last_time):
+    """Normalize a monitor timestamp to an aware UTC datetime."""
+    if last_time and last_time.tzinfo is None:
+        return last_time.replace(tzinfo=timezone.utc)
+    return last_time
 
 
 class LekkageAlarmSensor(SensorEntity):
@@ -12,52 +22,61 @@ class LekkageAlarmSensor(SensorEntity):
 
     _attr_device_class = SensorDeviceClass.TIMESTAMP
 
-    def __init__(self, entry_id: str, monitor=None) -> None:
+    def __init__(
+        self, entry_id: str, last_contact=None, monitor_entity_id: str | None = None
+    ) -> None:
         self._entry_id = entry_id
-        self._monitor = monitor
-        self._last_contact = monitor.last_contact_time if monitor else None
+        self._monitor_entity_id = monitor_entity_id
+        self._last_contact = _normalize_contact_time(last_contact)
         self._attr_name = "LekkageAlarm Last Contact"
         self._attr_unique_id = f"{entry_id}_last_contact"
+        self._identifiers = {(DOMAIN, entry_id)}
+        # Default device info; upgraded in async_added_to_hass only when the
+        # monitored entity is linked to a registry device.
+        self._attr_device_info = self._make_device_info()
+
+    def _make_device_info(self, ent_entry=None) -> device_registry.DeviceInfo:
+        """Build the device info, linking the monitored device when known."""
+        info: dict = {
+            "identifiers": self._identifiers,
+            "name": "LekkageAlarm Monitor",
+        }
+        if ent_entry and ent_entry.device_id:
+            info["name"] = ent_entry.original_name or ent_entry.entity_id
+            info["via_device_id"] = ent_entry.device_id
+        return device_registry.DeviceInfo(**info)
 
     @property
     def native_value(self):
-        """Return the state (timestamp of last contact in ISO format)."""
-        if not self._last_contact:
-            return None
-        return self._last_contact.strftime("%Y-%m-%dT%H:%M:%SZ")
+        """Return the timestamp of the last contact with the collector."""
+        return self._last_contact
 
     async def async_added_to_hass(self) -> None:
-        """Entity added to Home Assistant - set up dispatcher and device info."""
-        ent_reg = entity_registry.async_get(self.hass)
-        ent_entry = None
-        if self._monitor:
-            ent_entry = ent_reg.async_get(self._monitor.entity_id)
-        if ent_entry and ent_entry.device_id:
-            self._attr_device_info = device_registry.DeviceInfo(
-                identifiers={(DOMAIN, self._entry_id)},
-                name=(ent_entry.original_name or ent_entry.entity_id),
-                via_device_id=ent_entry.device_id,
-            )
-        else:
-            self._attr_device_info = device_registry.DeviceInfo(
-                identifiers={(DOMAIN, self._entry_id)},
-                name="LekkageAlarm Monitor",
+        """Entity added to Home Assistant - subscribe to updates and device info."""
+        if self._monitor_entity_id:
+            ent_entry = entity_registry.async_get(self.hass).async_get(
+                self._monitor_entity_id
             )
+            if ent_entry and ent_entry.device_id:
+                self._attr_device_info = self._make_device_info(ent_entry)
 
-        self.async_on_remove(
-            dispatcher.async_dispatcher_connect(
-                self.hass, f"{DOMAIN}_{self._entry_id}_update", self._handle_update
-            )
-        )
+        monitor = self.hass.data[DOMAIN][DATA_MONITORS].get(self._entry_id)
+        if monitor:
+            self.async_on_remove(monitor.async_add_listener(self._handle_update))
 
+    @callback
     def _handle_update(self, last_time) -> None:
         """Handle an update from the LekkageAlarm monitor."""
-        self._last_contact = last_time
+        self._last_contact = _normalize_contact_time(last_time)
         self.async_write_ha_state()
 
 
 async def async_setup_entry(hass, entry, async_add_entities):
     """Set up the LekkageAlarm sensor entity from a config entry."""
-    monitor = hass.data[DOMAIN].get(entry.entry_id)
-    sensor = LekkageAlarmSensor(entry.entry_id, monitor)
+    monitor = hass.data[DOMAIN][DATA_MONITORS].get(entry.entry_id)
+    sensor = LekkageAlarmSensor(
+        entry.entry_id,
+        last_contact=monitor.last_contact_time if monitor else None,
+        monitor_entity_id=monitor.entity_id if monitor else None,
+    )
     async_add_entities([sensor])